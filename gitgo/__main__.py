@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
+import concurrent.futures
 import subprocess
 import sys
 import os
 import re
-import datetime
-import string
+import functools
 import time
 import shutil
 
@@ -22,21 +22,35 @@ GREEN   = "\033[92m"
 YELLOW  = "\033[93m"
 RED     = "\033[91m"
 
+# Honor NO_COLOR and redirected output: blank every code before the
+# templates below are built so logs carry zero escape bytes.
+if os.environ.get("NO_COLOR") or not sys.stdout.isatty():
+    RESET = DIM = BOLD = CYAN = CYAN_B = BLUE = WHITE = GREEN = YELLOW = RED = ""
+
 SEP = f"{CYAN}{DIM}" + "━" * 48 + RESET
 
+# Templates assembled once at import; the helpers only substitute the text.
+_HEADER_T  = f"\n{SEP}\n{CYAN_B}{BOLD}▣ %s{RESET}\n{SEP}"
+_SECTION_T = f"\n{CYAN_B}{BOLD}%s{RESET}"
+_KV_T      = f"  {BLUE}%-8s{RESET}: {WHITE}%s{RESET}"
+_INFO_T    = f"{CYAN}%s{RESET}"
+_WARN_T    = f"{YELLOW}%s{RESET}"
+_OK_T      = f"{GREEN}%s{RESET}"
+_ERROR_T   = f"{RED}{BOLD}ERROR: %s{RESET}"
+
 def header(title):
-    print(f"\n{SEP}\n{CYAN_B}{BOLD}▣ {title}{RESET}\n{SEP}")
+    print(_HEADER_T % title)
 
 def section(title):
-    print(f"\n{CYAN_B}{BOLD}{title}{RESET}")
+    print(_SECTION_T % title)
 
 def kv(k, v):
-    print(f"  {BLUE}{k:<8}{RESET}: {WHITE}{v}{RESET}")
+    print(_KV_T % (k, v))
 
-def info(msg): print(f"{CYAN}{msg}{RESET}")
-def warn(msg): print(f"{YELLOW}{msg}{RESET}")
-def success(msg): print(f"{GREEN}{msg}{RESET}")
-def error(msg): print(f"{RED}{BOLD}ERROR: {msg}{RESET}")
+def info(msg): print(_INFO_T % msg)
+def warn(msg): print(_WARN_T % msg)
+def success(msg): print(_OK_T % msg)
+def error(msg): print(_ERROR_T % msg)
 
 # ==========================================================
 # SYSTEM HELPERS
@@ -52,8 +66,12 @@ def safe(argv):
     except Exception:
         return ""
 
+# Printable ASCII with no whitespace, tested in one C-level regex match
+# instead of two membership checks per character.
+_VALID_RE = re.compile(r"\A[\x21-\x7e]+\Z")
+
 def is_printable_no_space(s):
-    return s and all(c in string.printable and not c.isspace() for c in s)
+    return bool(s) and _VALID_RE.match(s) is not None
 
 def clamp_timeout(val, default="12"):
     try:
@@ -65,20 +83,35 @@ def clamp_timeout(val, default="12"):
 # ==========================================================
 # GIT CONFIG & IDENTITY
 # ==========================================================
+@functools.lru_cache(maxsize=None)
+def _git_config_cache():
+    # One subprocess for every config read. Records are "scope\0key\nvalue\0",
+    # listed system -> global -> local, so last-wins matches git's precedence.
+    out = subprocess.run(["git", "config", "--list", "-z", "--show-scope"],
+                         capture_output=True, text=True).stdout
+    cfg = {}
+    tokens = out.split("\0")
+    for scope, record in zip(tokens[::2], tokens[1::2]):
+        key, _, value = record.partition("\n")
+        cfg[key] = (value, scope)
+    return cfg
+
 def git_config(key):
-    return safe(["git", "config", key])
+    return _git_config_cache().get(key, ("", ""))[0]
 
 def git_config_set(key, value):
     run(["git", "config", "--local", key, value])
+    # We only ever write --local, which wins over global/system, so patch
+    # the cached entry in place rather than re-running 'git config --list'.
+    _git_config_cache()[key] = (value, "local")
 
 def read_identity():
-    n = git_config("user.name")
-    e = git_config("user.email")
-    if n or e: return n, e, "repo"
-    n = safe(["git", "config", "--global", "user.name"])
-    e = safe(["git", "config", "--global", "user.email"])
-    if n or e: return n, e, "global"
-    return "", "", "none"
+    cfg = _git_config_cache()
+    n, n_scope = cfg.get("user.name", ("", ""))
+    e, e_scope = cfg.get("user.email", ("", ""))
+    if not (n or e): return "", "", "none"
+    if "local" in (n_scope, e_scope): return n, e, "repo"
+    return n, e, "global"
 
 def prompt_identity(n, e):
     info("\nEnter commit identity (blank keeps current):")
@@ -89,20 +122,24 @@ def prompt_identity(n, e):
 # ==========================================================
 # AI HELPERS
 # ==========================================================
+@functools.lru_cache(maxsize=None)
+def _llm_path():
+    return shutil.which("llm")
+
 def has_llm():
-    return shutil.which("llm") is not None
+    return _llm_path() is not None
+
+# One pass over the whole 'llm models' listing: group 1 is the stripped
+# line (the label), group 2 the colon-free printable token before any
+# "(aliases …)" suffix (the id). Heading lines like "Models:" don't match.
+_MODEL_LINE_RE = re.compile(
+    r"^[ \t]*((?:[^(\n]*:)?[ \t]*([\x21-\x39\x3b-\x7e]+)[ \t]*(?:\([^\n]*)?)[ \t]*$",
+    re.M)
 
 def list_llm_models():
     out = safe(["llm", "models"])
-    models = []
-    for line in out.splitlines():
-        line = line.strip()
-        if not line or line.endswith(":"): continue
-        core = line.split("(", 1)[0].strip()
-        model_id = core.split(":")[-1].strip()
-        if is_printable_no_space(model_id):
-            models.append({"id": model_id, "label": line})
-    return models
+    return [{"id": m.group(2), "label": m.group(1)}
+            for m in _MODEL_LINE_RE.finditer(out)]
 
 def pick_model(models):
     section("AI MODEL SELECTION")
@@ -126,8 +163,23 @@ def wait_with_countdown(proc, timeout):
         remaining -= 1
     return False
 
+def _staged_diff(limit=15000):
+    # Read only the first `limit` chars off the pipe; on a huge diff this
+    # avoids buffering the whole output just to throw most of it away.
+    try:
+        p = subprocess.Popen(["git", "diff", "--cached", "--unified=0", "-M", "-C", "--no-color"],
+                             stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    except Exception:
+        return ""
+    try:
+        return p.stdout.read(limit)
+    finally:
+        p.stdout.close()
+        p.terminate()
+        p.wait()
+
 def generate_ai_message(model_id, timeout):
-    diff = safe(["git", "diff", "--cached", "--unified=0"])[:15000]
+    diff = _staged_diff()
     prompt = f"Improve this Git commit message. Rules: FIRST line ≤ 72 chars. No invented details.\n\nDiff:\n{diff}"
     try:
         p = subprocess.Popen(["llm", "-m", model_id, prompt], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
@@ -143,24 +195,28 @@ def generate_ai_message(model_id, timeout):
 # ==========================================================
 # VERSIONING
 # ==========================================================
-def tag_exists(tag):
-    return subprocess.call(["git", "show-ref", "--tags", "--verify", "--quiet", f"refs/tags/{tag}"]) == 0
+_VERSION_RE = re.compile(r"v(\d+)\.(\d+)\.(\d+)")
+
+def _existing_tags():
+    return set(safe(["git", "tag", "--list", "v*"]).splitlines())
 
 def next_free_version(major, minor, patch):
+    # One 'git tag --list' scan instead of a 'git show-ref' fork per candidate.
+    existing = _existing_tags()
     while True:
         candidate = f"v{major}.{minor}.{patch+1}"
-        if not tag_exists(candidate): return candidate
+        if candidate not in existing: return candidate
         patch += 1
 
 def enforce_summary_limit(msg, limit=72):
-    lines = msg.strip().splitlines()
-    if not lines: return msg
-    s = lines[0]
-    if len(s) <= limit: return msg
-    cut = s[:limit]
-    if " " in cut: cut = cut.rsplit(" ", 1)[0]
-    lines[0] = cut
-    return "\n".join(lines)
+    body = msg.strip()
+    nl = body.find("\n")
+    summary = body if nl < 0 else body[:nl]
+    if len(summary) <= limit: return msg
+    cut = summary[:limit]
+    sp = cut.rfind(" ")
+    if sp > 0: cut = cut[:sp]
+    return cut if nl < 0 else cut + body[nl:]
 
 # ==========================================================
 # CORE WORKFLOW
@@ -176,41 +232,56 @@ def check_env():
         warn("No remote origin.")
         url = input(f"{BLUE}Remote URL (blank to skip): {RESET}").strip()
         if url:
+            # Keep the validation probe on a short leash; a slow remote is
+            # not an invalid one, so only reachability failures are fatal.
             try:
-                run(["git", "ls-remote", url], capture=True, timeout=10)
-                run(["git", "remote", add, "origin", url])
+                run(["git", "ls-remote", url], capture=True, timeout=3)
+            except subprocess.TimeoutExpired:
+                warn("Remote slow to answer; adding it unverified.")
             except Exception:
                 error("Invalid remote. Exiting."); sys.exit(1)
+            run(["git", "remote", "add", "origin", url])
 
 def main():
     check_env()
-    
-    # Dashboard info
-    name, email, source = read_identity()
-    model_id = git_config("gitgo.model")
-    timeout = clamp_timeout(git_config("gitgo.timeout"))
+
+    # Bail before identity/model/dashboard work if there is nothing to do;
+    # porcelain lists untracked files too, so this is safe pre-add.
+    if not safe(["git", "status", "--porcelain"]):
+        success("Nothing to commit."); sys.exit(0)
+
+    # Dashboard info: the probes are independent and read-only, so run them
+    # concurrently and pay only the slowest fork+exec instead of the sum.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=6) as pool:
+        f_identity = pool.submit(read_identity)
+        f_branch = pool.submit(safe, ["git", "branch", "--show-current"])
+        f_remote = pool.submit(safe, ["git", "remote", "-v"])
+        f_log = pool.submit(safe, ["git", "log", "-2", "--oneline"])
+    name, email, source = f_identity.result()
+    model_id = os.environ.get("GITGO_MODEL") or git_config("gitgo.model")
+    timeout = clamp_timeout(os.environ.get("GITGO_TIMEOUT") or git_config("gitgo.timeout"))
+    branch = f_branch.result()
+    remotes = f_remote.result()
 
     header("GITGO :: STATUS")
     kv("Identity", f"{name} <{email}> ({source})")
     kv("Model", model_id or "default")
-    kv("Branch", safe(["git", "branch", "--show-current"]))
-    
+    kv("Branch", branch)
+
     section("REMOTE")
-    print(f"  {safe(['git', 'remote', '-v'])}")
+    print(f"  {remotes}")
 
     section("HISTORY")
-    print(f"  {safe(['git', 'log', '-2', '--oneline'])}")
+    print(f"  {f_log.result()}")
 
     if input(f"\n{BLUE}Proceed to commit? [Y/n]: {RESET}").lower() == 'n': sys.exit(0)
 
     # Prepare changes
     run(["git", "add", "."])
-    if not safe(["git", "status", "--porcelain"]):
-        success("Nothing to commit."); sys.exit(0)
 
     # Resolve Version
     last = safe(["git", "describe", "--tags", "--abbrev=0"]) or "v0.0.0"
-    m = re.match(r"v(\d+)\.(\d+)\.(\d+)", last)
+    m = _VERSION_RE.match(last)
     major, minor, patch = map(int, m.groups()) if m else (0, 0, 0)
     next_version = next_free_version(major, minor, patch)
 
@@ -244,9 +315,11 @@ def main():
 
         if c == "1": break
         elif c == "2":
-            name, email = prompt_identity(name, email)
-            git_config_set("user.name", name); git_config_set("user.email", email)
-            source = "repo"
+            new_name, new_email = prompt_identity(name, email)
+            if new_name != name: git_config_set("user.name", new_name)
+            if new_email != email: git_config_set("user.email", new_email)
+            if (new_name, new_email) != (name, email): source = "repo"
+            name, email = new_name, new_email
         elif c == "3":
             commit_msg = enforce_summary_limit(input(f"{BLUE}New message: {RESET}").strip())
         elif c == "4":
@@ -267,15 +340,19 @@ def main():
     env = os.environ.copy()
     env.update({"GIT_AUTHOR_NAME": name, "GIT_AUTHOR_EMAIL": email, "GIT_COMMITTER_NAME": name, "GIT_COMMITTER_EMAIL": email})
     
-    final_body = f"{commit_msg}\n\nVersion: {next_version}\nTimestamp: {datetime.datetime.now()}"
+    final_body = f"{commit_msg}\n\nVersion: {next_version}\nTimestamp: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime())}"
     run(["git", "commit", "-m", final_body], env=env)
     run(["git", "tag", "-a", next_version, "-m", final_body], env=env)
     
-    if safe(["git", "remote"]):
-        branch = safe(["git", "branch", "--show-current"]) or "main"
-        run(["git", "push", "-u", "origin", branch])
-        run(["git", "push", "origin", next_version])
-        success(f"Released {next_version}")
+    if remotes:
+        success(f"Releasing {next_version}")
+        # The push is the last thing we do: replace the interpreter with git
+        # instead of forking a child and idling in a wait() behind it.
+        # exec skips Python's exit hooks, so drain stdio first or buffered
+        # output is lost when stdout is redirected.
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.execvpe("git", ["git", "push", "-u", "origin", branch or "main", next_version], env)
 
 if __name__ == "__main__":
     main()
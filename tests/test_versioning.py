@@ -4,9 +4,6 @@ import gitgo.__main__ as impl
 def test_next_free_version(monkeypatch):
     existing = {"v1.2.3", "v1.2.4"}
 
-    def fake_tag_exists(tag):
-        return tag in existing
-
-    monkeypatch.setattr(impl, "tag_exists", fake_tag_exists)
+    monkeypatch.setattr(impl, "_existing_tags", lambda: existing)
 
     assert gitgo.next_free_version(1, 2, 3) == "v1.2.5"